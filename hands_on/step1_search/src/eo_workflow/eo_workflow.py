@@ -9,13 +9,6 @@
 # ------------------------------------------------------------------------------
 # Imports
 # ------------------------------------------------------------------------------
-from pystac_client import Client
-from odc.stac import load
-import pystac
-import xarray as xr
-import pandas as pd
-import numpy as np
-import sys
 import os
 
 from eo_workflow import (
@@ -35,21 +28,31 @@ class EOWorkflow:
         ----------
         config_dir : str
             Path to the directory containing search, load, and filter parameter files.
+            All configuration files are loaded and validated once at construction.
         """
         self.config_dir = os.path.abspath(os.path.expanduser(config_dir))
         self.search_config = None
         self.load_config = None
         self.filter_config = None
+        self._load_all_configs()
+
+    def _load_all_configs(self):
+        """
+        Load and validate all YAML configuration files of the workflow once.
+        """
+        loaders = {
+            "search_config": (search_sentinel_2.load_stac_search_parameters, "search_parameters.yml")
+        }
+
+        for attr, (loader, filename) in loaders.items():
+            setattr(self, attr, loader(os.path.join(self.config_dir, filename)))
 
     def perform(self):
         """
         Execute the complete Sentinel-2 Earth Observation processing workflow:
         1. Load search configuration
         """
-        # Step 1: Load search parameters
-        self.search_config = search_sentinel_2.load_stac_search_parameters(
-            os.path.join(self.config_dir, "search_parameters.yml")
-        )
+        # Step 1: Show search parameters
         search_sentinel_2.print_stac_search_parameters(self.search_config)
 
         # Step 2: Search STAC items
@@ -5,10 +5,13 @@
 # Author: Mike Sips
 # ==============================================================================
 
-from pystac_client import Client
 import pystac
 import os
-import yaml
+import sys
+from functools import lru_cache
+from typing import Iterator, Union
+
+from eo_workflow import config_cache
 
 # ------------------------------------------------------------------------------
 # Constants
@@ -49,8 +52,7 @@ def load_stac_search_parameters(config_filename: str = "search_parameters.yml")
     if not os.path.isfile(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    config = config_cache.load_yaml_cached(config_path)
 
     if not isinstance(config, dict):
         raise ValueError("YAML content must be a dictionary")
@@ -123,12 +125,35 @@ def print_stac_items(items: list, cloud_cover_threshold: float = 1.0) -> None:
         raise TypeError("items must contain only pystac.Item objects")
 
     print(f"[INFO] Found {len(items)} items with cloud cover < {cloud_cover_threshold}%\n")
+
+    # Assemble the listing for all items and write it in one call
+    separator = "-" * 60
+    lines = []
     for item in items:
-        print(f"ID:        {item.id}")
-        print(f"Datetime:  {item.datetime}")
-        print(f"BBox:      {item.bbox}")
-        print(f"Assets:    {list(item.assets.keys())}")
-        print("-" * 60)
+        lines.extend((
+            f"ID:        {item.id}",
+            f"Datetime:  {item.datetime}",
+            f"BBox:      {item.bbox}",
+            f"Assets:    {list(item.assets.keys())}",
+            separator
+        ))
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+# ------------------------------------------------------------------------------
+# Function: _open_catalog
+# Purpose : Open a STAC API catalog once per URL and reuse the client
+# ------------------------------------------------------------------------------
+@lru_cache(maxsize=8)
+def _open_catalog(catalog_url: str):
+    """
+    Return a pystac_client.Client for `catalog_url`, fetching the root catalog
+    only on the first call for each URL.
+    """
+    # Imported lazily: pystac_client is only needed once a search is performed
+    from pystac_client import Client
+
+    return Client.open(catalog_url)
 
 # ------------------------------------------------------------------------------
 # Function: search_sentinel2
@@ -138,8 +163,9 @@ def search_sentinel2(
     catalog_url: str,
     bbox: list,
     date_range: str,
-    cloud_cover_threshold: float = 1.0
-) -> list:
+    cloud_cover_threshold: float = 1.0,
+    as_iterator: bool = False
+) -> Union[list, Iterator]:
     """
     Query a STAC endpoint for Sentinel-2 Level-2A imagery with low cloud cover.
 
@@ -153,11 +179,15 @@ def search_sentinel2(
         ISO 8601 date interval (e.g., "2020-06-01/2020-12-30").
     cloud_cover_threshold : float
         Maximum cloud cover percentage (default: 1.0).
+    as_iterator : bool
+        If True, return a lazy iterator that fetches result pages on demand,
+        so consumers can start processing before all pages are paginated
+        (default: False).
 
     Returns
     -------
-    list of pystac.Item
-        List of matching STAC items.
+    list of pystac.Item or iterator of pystac.Item
+        Matching STAC items; an iterator if `as_iterator` is True.
 
     Raises
     ------
@@ -174,9 +204,11 @@ def search_sentinel2(
         raise TypeError("cloud_cover_threshold must be a number")
     if not (0 <= cloud_cover_threshold <= 100):
         raise ValueError("cloud_cover_threshold must be between 0 and 100")
+    if not isinstance(as_iterator, bool):
+        raise TypeError("as_iterator must be a boolean")
 
     print("[INFO] Connecting to STAC catalog...")
-    catalog = Client.open(catalog_url)
+    catalog = _open_catalog(catalog_url)
 
     print("[INFO] Performing search query...")
     search = catalog.search(
@@ -189,5 +221,7 @@ def search_sentinel2(
     print("[INFO] Search Completed.")
     print(f"[INFO] Number of matched items: {search.matched()}")
 
+    if as_iterator:
+        return search.items()
     return list(search.items())
 
@@ -9,13 +9,8 @@
 # ------------------------------------------------------------------------------
 # Imports
 # ------------------------------------------------------------------------------
-from pystac_client import Client
-from odc.stac import load
-import pystac
-import xarray as xr
-import pandas as pd
-import numpy as np
-import sys
+from concurrent.futures import ThreadPoolExecutor
+import importlib
 import os
 
 from eo_workflow import (
@@ -38,47 +33,67 @@ class EOWorkflow:
         ----------
         config_dir : str
             Path to the directory containing search, load, and filter parameter files.
+            All configuration files are loaded and validated once at construction.
         """
         self.config_dir = os.path.abspath(os.path.expanduser(config_dir))
         self.search_config = None
         self.load_config = None
         self.filter_config = None
         self.visualize_scl_config = None
+        self._load_all_configs()
+
+    def _load_all_configs(self):
+        """
+        Load and validate all YAML configuration files of the workflow once.
+        """
+        loaders = {
+            "search_config": (search_sentinel_2.load_stac_search_parameters, "search_parameters.yml"),
+            "load_config": (load_sentinel_2.load_stac_load_parameters, "load_parameters.yml"),
+            "visualize_scl_config": (visualize_scl_sentinel_2.load_visualize_scl_parameters, "visualize_scl_parameters.yml")
+        }
+
+        for attr, (loader, filename) in loaders.items():
+            setattr(self, attr, loader(os.path.join(self.config_dir, filename)))
 
     def perform(self):
         """
         Execute the complete Sentinel-2 Earth Observation processing workflow:
         1. Load search configuration
         """
-        # Step 1: Load search parameters
-        self.search_config = search_sentinel_2.load_stac_search_parameters(
-            os.path.join(self.config_dir, "search_parameters.yml")
-        )
+        # Step 1: Show search parameters
         search_sentinel_2.print_stac_search_parameters(self.search_config)
 
-        # Step 2: Search STAC items
-        items = search_sentinel_2.search_sentinel2(
-            catalog_url=self.search_config["catalog_url"],
-            bbox=self.search_config["bbox"],
-            date_range=self.search_config["date_range"],
-            cloud_cover_threshold=self.search_config["cloud_cover_threshold"]
-        )
+        # Step 2: Search STAC items, importing odc.stac in the background meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            odc_stac_import = executor.submit(importlib.import_module, "odc.stac")
+            items = search_sentinel_2.search_sentinel2(
+                catalog_url=self.search_config["catalog_url"],
+                bbox=self.search_config["bbox"],
+                date_range=self.search_config["date_range"],
+                cloud_cover_threshold=self.search_config["cloud_cover_threshold"]
+            )
+            # Surface a failed import here rather than as a confusing load error
+            odc_stac_import.result()
 
         search_sentinel_2.print_stac_items(items)
 
         # Step 3: Load STAC items
-        self.load_config = load_sentinel_2.load_stac_load_parameters(
-            os.path.join(self.config_dir, "load_parameters.yml")
-        )
         load_sentinel_2.print_stac_load_parameters(self.load_config)
 
         data_set = load_sentinel_2.load_sentinel2_xarray(
             items=items,
             band_keys=self.load_config["bands"],
             resolution=self.load_config["resolution"],
-            aggregation=self.load_config["aggregation"]
+            aggregation=self.load_config["aggregation"],
+            chunks=self.load_config["chunks"],
+            bbox=self.search_config["bbox"],
+            cache_dir=self.load_config.get("cache_dir")
         )
 
+        # Optionally down-sample on the Dask graph instead of reloading at a coarser resolution
+        coarsen_factor = self.load_config.get("coarsen_factor") or 1
+        data_set = load_sentinel_2.coarsen_dataset(data_set, coarsen_factor)
+
         # Step 4: Clip to bounding box
         clipped_data_set = clip_sentinel_2.clip_dataset_to_bbox(
             dataset=data_set,
@@ -86,9 +101,6 @@ class EOWorkflow:
         )
 
         # visualize clipped Sentinel-2 SCL Layer
-        self.visualize_scl_config = visualize_scl_sentinel_2.load_visualize_scl_parameters (
-            os.path.join(self.config_dir, "visualize_scl_parameters.yml")
-        )
         visualize_scl_sentinel_2.plot_all_scl_scenes(
             dataset = clipped_data_set,
             save_dir = self.visualize_scl_config["clipped_scl_save_dir"]
@@ -13,6 +13,7 @@
 # ------------------------------------------------------------------------------
 import sys
 import os
+import logging
 
 # ------------------------------------------------------------------------------
 # Add 'src' Directory to sys.path
@@ -43,6 +44,10 @@ if __name__ == "__main__":
         2. STAC data loading
         3. Spatial clipping
     """
+    # Modules using `logging` report in the same "[INFO] ..." format as print()
+    # Log to stdout so records interleave with the print-based progress messages
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s", stream=sys.stdout)
+
     workflow = eo_workflow.EOWorkflow("./config/eo_workflow/")
     workflow.perform()
 
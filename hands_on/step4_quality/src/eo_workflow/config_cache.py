@@ -0,0 +1,60 @@
+# ==============================================================================
+# File: config_cache.py
+# Purpose: Cached loading of the YAML configuration files of the workflow.
+#          Kept free of the numerical dependencies so every step can use it.
+# Author: Mike Sips
+# ==============================================================================
+
+import os
+import copy
+import yaml
+
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# ------------------------------------------------------------------------------
+# Parsed YAML configurations, keyed by absolute path
+# ------------------------------------------------------------------------------
+_YAML_CACHE: dict[str, tuple[tuple, object]] = {}
+
+# ------------------------------------------------------------------------------
+# Function: load_yaml_cached
+# Purpose : Parse a YAML file once and reuse the result until the file changes
+# ------------------------------------------------------------------------------
+def load_yaml_cached(path: str) -> object:
+    """
+    Load a YAML file, reusing the parsed content while the file is unchanged.
+
+    Parameters
+    ----------
+    path : str
+        Path to the YAML file.
+
+    Returns
+    -------
+    object
+        Parsed YAML content (typically a dict). A deep copy is returned, so callers
+        may modify it without affecting the cached version.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    yaml.YAMLError
+        If the YAML syntax is invalid.
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[0] != signature:
+        with open(path, "r") as f:
+            content = yaml.load(f, Loader=_YamlLoader)
+        cached = (signature, content)
+        _YAML_CACHE[path] = cached
+
+    return copy.deepcopy(cached[1])
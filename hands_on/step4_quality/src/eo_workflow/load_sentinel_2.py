@@ -7,14 +7,26 @@
 # ==============================================================================
 
 import os
-import yaml
+import json
+import shutil
+import hashlib
 import xarray as xr
 import pystac
-from odc.stac import load
+from typing import Optional
+
+from eo_workflow import config_cache
 
 # Required configuration keys for loading
 REQUIRED_KEYS = ["bands", "resolution", "aggregation", "chunks"]
 
+# Dask chunking used when the configuration leaves 'chunks' empty.
+# Spatial sizes are a multiple of the 512 px internal tiling of the Sentinel-2 COGs.
+DEFAULT_CHUNKS = {"time": 1, "y": 2048, "x": 2048}
+
+# Output data types pinned per band. SCL codes (0–11) fit in uint8; pinning it
+# prevents an upcast when nodata handling or grouping would otherwise widen it.
+BAND_DTYPES = {"scl": "uint8"}
+
 # ------------------------------------------------------------------------------
 # Function: load_stac_load_parameters
 # Purpose : Load configuration parameters for odc.stac.load from a YAML file
@@ -53,8 +65,7 @@ def load_stac_load_parameters(config_filename: str = "search_parameters.yml") ->
     if not os.path.isfile(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    config = config_cache.load_yaml_cached(config_path)
 
     if not isinstance(config, dict):
         raise ValueError("YAML content must be a dictionary")
@@ -104,9 +115,32 @@ def print_stac_load_parameters(loader_config: dict) -> None:
     print(f"Bands to load:         {loader_config.get('bands', [])}")
     print(f"Spatial resolution:    {loader_config.get('resolution')} m")
     print(f"Aggregation enabled:   {loader_config.get('aggregation')}")
+    print(f"Dataset cache:         {loader_config.get('cache_dir') or '(disabled)'}")
 
     chunks = loader_config.get("chunks", {})
-    print(f"Dask chunks:           {chunks if chunks else '(default / automatic)'}\n")
+    print(f"Dask chunks:           {chunks if chunks else f'(default) {DEFAULT_CHUNKS}'}\n")
+
+# ------------------------------------------------------------------------------
+# Function: _dataset_cache_path
+# Purpose : Build the on-disk Zarr cache location for a set of STAC items
+# ------------------------------------------------------------------------------
+def _dataset_cache_path(
+    items: list,
+    band_keys: list[str],
+    resolution: int,
+    aggregation: bool,
+    bbox: Optional[list[float]],
+    cache_dir: str
+) -> str:
+    """
+    Return the Zarr store path used to cache a loaded dataset.
+
+    The cache key is derived from the STAC item ids and the load parameters,
+    so a different search result or band selection never hits a stale entry.
+    """
+    key_source = json.dumps([sorted(i.id for i in items), band_keys, resolution, aggregation, bbox])
+    cache_key = hashlib.sha1(key_source.encode()).hexdigest()[:16]
+    return os.path.join(os.path.abspath(os.path.expanduser(cache_dir)), f"{cache_key}.zarr")
 
 # ------------------------------------------------------------------------------
 # Function: load_sentinel2_xarray
@@ -116,7 +150,10 @@ def load_sentinel2_xarray(
     items: list,
     band_keys: list[str] = ["red", "nir", "scl"],
     resolution: int = 60,
-    aggregation: bool = True
+    aggregation: bool = True,
+    chunks: Optional[dict] = None,
+    bbox: Optional[list[float]] = None,
+    cache_dir: Optional[str] = None
 ) -> xr.Dataset:
     """
     Load Sentinel-2 STAC items into an xarray.Dataset using `odc.stac.load`.
@@ -131,6 +168,20 @@ def load_sentinel2_xarray(
         Spatial resolution in meters.
     aggregation : bool
         If True, group by solar day.
+    chunks : dict, optional
+        Dask chunk sizes per dimension (e.g., {"time": 1, "y": 2048, "x": 2048}).
+        The 'y' and 'x' sizes should be multiples of the COG block shape (256 or 512)
+        so that each chunk maps onto whole internal tiles. If None or empty,
+        DEFAULT_CHUNKS is used.
+    bbox : list of float, optional
+        Bounding box [min_lon, min_lat, max_lon, max_lat] in EPSG:4326. If given,
+        only pixels within this area are loaded, so chunks outside the area of
+        interest are never read. If None (default), the full scene footprint is loaded.
+    cache_dir : str, optional
+        Directory for a local Zarr cache of the loaded dataset (requires `zarr`).
+        The first call writes the data to disk; subsequent calls with the same
+        items and parameters read the local store instead of the remote COGs.
+        If None (default), no cache is used.
 
     Returns
     -------
@@ -152,15 +203,107 @@ def load_sentinel2_xarray(
         raise TypeError("resolution must be an integer")
     if not isinstance(aggregation, bool):
         raise TypeError("aggregation must be a boolean")
+    if chunks is not None and not isinstance(chunks, dict):
+        raise TypeError("chunks must be a dictionary")
+    if bbox is not None and not (isinstance(bbox, list) and len(bbox) == 4 and all(isinstance(v, (int, float)) for v in bbox)):
+        raise ValueError("bbox must be a list of four floats or ints")
+    if cache_dir is not None and not isinstance(cache_dir, str):
+        raise TypeError("cache_dir must be a string")
+
+    cache_path = None
+    if cache_dir:
+        cache_path = _dataset_cache_path(items, band_keys, resolution, aggregation, bbox, cache_dir)
+        if os.path.isdir(cache_path):
+            print(f"[INFO] Loading cached dataset from {cache_path}")
+            return xr.open_zarr(cache_path, chunks={})
+
+    # Imported lazily: odc.stac is only needed once data is actually loaded
+    from odc.stac import load
 
     print("[INFO] Loading data into xarray.Dataset...")
     dataset = load(
         items,
         bands=band_keys,
         resolution=resolution,
+        dtype={band: dtype for band, dtype in BAND_DTYPES.items() if band in band_keys} or None,
         groupby="solar_day" if aggregation else None,
-        chunks={}  # Enable Dask lazy loading
+        chunks=chunks or DEFAULT_CHUNKS,  # Enable Dask lazy loading
+        bbox=bbox
     )
     print("[INFO] Loading Successful.")
 
+    if cache_path:
+        # Write to a temporary store first so an interrupted run leaves no partial cache
+        print(f"[INFO] Writing dataset cache to {cache_path}")
+        # The temporary name is per process so concurrent runs do not share it
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        dataset.to_zarr(tmp_path, mode="w", compute=True)
+        try:
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # A complete cache appeared meanwhile (e.g. a concurrent run): keep that one
+            if not os.path.isdir(cache_path):
+                raise
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        dataset = xr.open_zarr(cache_path, chunks={})
+
     return dataset
+
+# ------------------------------------------------------------------------------
+# Function: coarsen_dataset
+# Purpose : Spatially down-sample a loaded dataset by an integer factor
+# ------------------------------------------------------------------------------
+def coarsen_dataset(
+    dataset: xr.Dataset,
+    factor: int
+) -> xr.Dataset:
+    """
+    Down-sample a loaded Sentinel-2 dataset by aggregating factor x factor pixel blocks.
+
+    Runs as block reductions on the existing Dask graph, which is much cheaper than
+    loading the scenes a second time at a coarser resolution.
+
+    Parameters
+    ----------
+    dataset : xr.Dataset
+        Dataset with 'y' and 'x' dimensions, as returned by `load_sentinel2_xarray`.
+    factor : int
+        Number of pixels to aggregate along each spatial axis (e.g., 6 for 10 m → 60 m).
+        Edge pixels that do not fill a whole block are trimmed.
+
+    Returns
+    -------
+    xr.Dataset
+        Coarsened dataset. The 'scl' band is reduced with max (a proxy for the
+        majority class that keeps valid integer codes); all other bands with mean.
+
+    Raises
+    ------
+    TypeError
+        If dataset is not an xarray.Dataset or factor is not an integer.
+    ValueError
+        If factor is smaller than 1.
+    """
+    if not isinstance(dataset, xr.Dataset):
+        raise TypeError("dataset must be an xarray.Dataset")
+    if not isinstance(factor, int):
+        raise TypeError("factor must be an integer")
+    if factor < 1:
+        raise ValueError("factor must be at least 1")
+    if factor == 1:
+        return dataset
+
+    print(f"[INFO] Coarsening dataset by a factor of {factor}...")
+    categorical = [band for band in ("scl",) if band in dataset]
+    continuous = [band for band in dataset.data_vars if band not in categorical]
+
+    # Coarsen only the non-empty subsets; merging an empty one would fail
+    parts = []
+    if categorical:
+        parts.append(dataset[categorical].coarsen(y=factor, x=factor, boundary="trim").max())
+    if continuous:
+        parts.append(dataset[continuous].coarsen(y=factor, x=factor, boundary="trim").mean())
+
+    coarsened = xr.merge(parts)
+    coarsened.attrs = dataset.attrs
+    return coarsened
@@ -4,19 +4,23 @@
 # Author: Mike Sips
 # ==============================================================================
 
+import logging
 import xarray as xr
 import numpy as np
 import pandas as pd
+from typing import Optional
 
 from eo_workflow import util
 
+logger = logging.getLogger(__name__)
+
 # ------------------------------------------------------------------------------
 # Function: plot_scl_histogram
 # Purpose : Plot a histogram of SCL class frequencies for a single scene
 # ------------------------------------------------------------------------------
 def plot_scl_histogram(
     scene: xr.DataArray,
-    valid_classes: list[int] = list(range(12)),
+    valid_classes: Optional[list[int]] = None,
     title: str = "SCL Class Distribution",
     aggregated: bool = True
 ) -> None:
@@ -29,7 +33,8 @@ def plot_scl_histogram(
         A 2D image slice from the SCL band, typically selected via:
         `ds["scl"].isel(time=0)`.
     valid_classes : list of int, optional
-        List of class codes to include in the plot. Defaults to [0–11].
+        List of class codes to include in the plot. Defaults to None, i.e. all
+        classes 0–11.
     title : str, optional
         Title for the plot. Default: "SCL Class Distribution".
     aggregated : bool, optional
@@ -54,24 +59,145 @@ def plot_scl_histogram(
     Returns
     -------
     None
-        Displays and saves a histogram plot as a PNG file.
+        Draws the histogram on an off-screen figure and saves it as a PNG file
+        named after the scene's date.
     """
-    classes, frequencies = calculate_scl_histogram(scene, valid_classes)
+    # Imported here so the quality assessment does not require matplotlib
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    classes, frequencies = util.calculate_scl_histogram(scene, valid_classes)
 
-    plt.figure(figsize=(10, 6))
-    plt.bar(classes, frequencies, tick_label=classes)
-    plt.xlabel("SCL Class")
-    plt.ylabel("Number of Pixels")
-    plt.title(title)
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.tight_layout()
+    # Rendered off-screen with Agg, so no pyplot figure manager is involved
+    figure = Figure(figsize=(10, 6))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    ax.bar(classes, frequencies, tick_label=classes)
+    ax.set_xlabel("SCL Class")
+    ax.set_ylabel("Number of Pixels")
+    ax.set_title(title)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    figure.tight_layout()
 
     timestamp = pd.to_datetime(scene.time.values)
     suffix = timestamp.strftime("%Y-%m-%d" if aggregated else "%Y-%m-%dT%H-%M-%S")
     outputfile = f"{suffix}.png"
 
-    plt.savefig(outputfile)
-    plt.close()
+    figure.savefig(outputfile)
+
+# ------------------------------------------------------------------------------
+# Function: quality_report_array
+# Purpose : Count SCL class pixels for all scenes in a single Dask pass
+# ------------------------------------------------------------------------------
+def quality_report_array(scl: xr.DataArray) -> xr.DataArray:
+    """
+    Count pixels per SCL class for every scene of a time series.
+
+    The counting runs as a single `xr.apply_ufunc` over the whole SCL cube,
+    so Dask-backed inputs are reduced block by block in one graph execution.
+    Dask inputs are rechunked so that every block spans full scenes in (y, x).
+
+    Parameters
+    ----------
+    scl : xr.DataArray
+        SCL band with 'y' and 'x' dimensions (typically also 'time').
+
+    Returns
+    -------
+    xr.DataArray
+        Integer pixel counts with the spatial dimensions replaced by a
+        'scl_class' dimension of length 12 (classes 0–11).
+    """
+    if not isinstance(scl, xr.DataArray):
+        raise TypeError("scl must be an xarray.DataArray.")
+
+    # Each block must hold whole scenes: the counts reduce over all of (y, x)
+    if scl.chunks is not None:
+        scl = scl.chunk({"y": -1, "x": -1})
+
+    counts = xr.apply_ufunc(
+        util.compute_scl_counts,
+        scl,
+        input_core_dims=[["y", "x"]],
+        output_core_dims=[["scl_class"]],
+        dask="parallelized",
+        output_dtypes=[np.int64],
+        dask_gufunc_kwargs={"output_sizes": {"scl_class": 12}}
+    )
+    return counts.assign_coords(scl_class=np.arange(12))
+
+# ------------------------------------------------------------------------------
+# Function: scl_summary
+# Purpose : Derive all per-scene SCL metrics from a single class-count pass
+# ------------------------------------------------------------------------------
+def scl_summary(
+    scl: xr.DataArray,
+    valid_classes: list[int] = list(range(1, 12))
+) -> xr.Dataset:
+    """
+    Summarize the SCL band of a time series in a single pass over its pixels.
+
+    The class counts are computed once and every downstream metric (quality
+    ratios, vegetation pixel counts) is derived from them, so the quality
+    assessment and the vegetation time series do not each re-read the SCL data.
+
+    Parameters
+    ----------
+    scl : xr.DataArray
+        SCL band with 'time', 'y' and 'x' dimensions (in any order). Dask-backed
+        input works best chunked as {"time": 1, "y": -1, "x": -1}, so that each
+        task owns one full scene.
+    valid_classes : list of int, optional
+        SCL class codes considered valid (default: [1–11], excludes 'No Data').
+
+    Returns
+    -------
+    xr.Dataset
+        Dataset indexed by 'time' with variables:
+        - 'counts' (time, scl_class): pixel count per SCL class.
+        - 'total_pixels', 'valid_pixels', 'cloud_pixels', 'vegetation_pixels' (time): pixel counts.
+        - 'valid_ratio' (time): proportion of valid pixels.
+        - 'coverage' (time): estimated coverage excluding cloud pixels.
+    """
+    if not isinstance(scl, xr.DataArray):
+        raise TypeError("scl must be an xarray.DataArray.")
+    if "time" not in scl.dims:
+        raise ValueError("SCL input must have a 'time' dimension.")
+
+    # Put the spatial axes last so each scene is a contiguous run of pixels
+    scl = scl.transpose("time", "y", "x")
+
+    # Per-class pixel counts for all scenes, shape (time, 12)
+    counts = quality_report_array(scl).compute()
+    counts_np = counts.values
+
+    total_pixels = counts_np.sum(axis=1)
+    # Only codes 0–11 occur in the SCL; other requested classes count no pixels
+    classes = np.unique(np.asarray(valid_classes, dtype=np.int64))
+    classes = classes[(classes >= 0) & (classes < counts_np.shape[1])]
+    valid_pixels = counts_np[:, classes].sum(axis=1)
+    valid_ratio = np.divide(
+        valid_pixels, total_pixels, out=np.zeros(len(counts_np)), where=total_pixels > 0
+    )
+
+    vegetation_pixels = counts_np[:, 4]
+    cloud_pixels = counts_np[:, 7:11].sum(axis=1)
+    coverage = np.where(
+        cloud_pixels < vegetation_pixels, 1 - cloud_pixels / np.maximum(vegetation_pixels, 1), 0.0
+    )
+
+    return xr.Dataset(
+        {
+            "counts": counts,
+            "total_pixels": ("time", total_pixels),
+            "valid_pixels": ("time", valid_pixels),
+            "cloud_pixels": ("time", cloud_pixels),
+            "vegetation_pixels": ("time", vegetation_pixels),
+            "valid_ratio": ("time", valid_ratio),
+            "coverage": ("time", coverage)
+        },
+        coords={"time": scl.time.values}
+    )
 
 # ------------------------------------------------------------------------------
 # Function: assess_sentinel2_quality
@@ -81,7 +207,8 @@ def assess_sentinel2_quality(
     data_set: xr.Dataset,
     valid_classes: list[int] = list(range(1, 12)),
     aggregated: bool = True,
-    verbose: bool = True
+    verbose: bool = True,
+    summary: Optional[xr.Dataset] = None
 ) -> dict:
     """
     Assess Sentinel-2 data quality using the Scene Classification Layer (SCL).
@@ -95,7 +222,10 @@ def assess_sentinel2_quality(
     aggregated : bool, optional
         If True, uses date-only format for output timestamps. Default: True.
     verbose : bool, optional
-        If True, print statistics for each scene. Default: True.
+        If True, log statistics for each scene. Default: True.
+    summary : xr.Dataset, optional
+        Precomputed result of `scl_summary` for `data_set`. If None (default),
+        it is computed here.
 
     Returns
     -------
@@ -106,7 +236,7 @@ def assess_sentinel2_quality(
         - 'total_pixels' (int): Count of total pixels.
         - 'coverage' (float): Estimated coverage excluding cloud pixels.
     """
-    print("[INFO] Generating Quality Report...")
+    logger.info("Generating Quality Report...")
 
     if not isinstance(data_set, xr.Dataset):
         raise TypeError("Input must be an xarray.Dataset.")
@@ -118,33 +248,39 @@ def assess_sentinel2_quality(
     if "time" not in scl.dims:
         raise ValueError("SCL input must have a 'time' dimension.")
 
-    quality_report = {}
+    if summary is None:
+        summary = scl_summary(scl, valid_classes)
 
-    for scene_id in range(scl.sizes["time"]):
-        scl_scene = scl.isel(time=scene_id)
+    total_pixels = summary["total_pixels"].values
+    valid_pixels = summary["valid_pixels"].values
+    valid_ratio = summary["valid_ratio"].values
+    cloud_pixels = summary["cloud_pixels"].values
+    coverage = summary["coverage"].values
 
-        classes, frequencies = util.calculate_scl_histogram(scl_scene)
-        total_pixels = sum(frequencies)
-        valid_pixels = sum(frequencies[1:])  # skip class 0 (No Data)
-        valid_ratio = valid_pixels / total_pixels if total_pixels else 0
+    timestamps = pd.to_datetime(scl.time.values).strftime(
+        "%Y-%m-%d" if aggregated else "%Y-%m-%dT%H:%M:%S"
+    )
 
-        cloud_pixels = sum(frequencies[7:11])
-        coverage = 1 - (cloud_pixels / frequencies[4]) if frequencies[4] else 0
-        coverage = coverage if (cloud_pixels < frequencies[4]) else 0
+    quality_report = {}
 
-        timestamp = pd.to_datetime(scl_scene.time.values)
-        timestamp_str = timestamp.strftime("%Y-%m-%d" if aggregated else "%Y-%m-%dT%H:%M:%S")
+    # Per-scene records are only created when INFO logging is enabled
+    log_scenes = verbose and logger.isEnabledFor(logging.INFO)
 
-        if verbose:
-            print(f"[INFO] {timestamp_str}: total_pixels={total_pixels}; valid_pixels={valid_pixels}; valid ratio={valid_ratio:.2%}; cloud_pixels={cloud_pixels}; coverage={coverage:.2%}")
+    for scene_id, timestamp_str in enumerate(timestamps):
+        if log_scenes:
+            logger.info(
+                "%s: total_pixels=%d; valid_pixels=%d; valid ratio=%.2f%%; cloud_pixels=%d; coverage=%.2f%%",
+                timestamp_str, total_pixels[scene_id], valid_pixels[scene_id], valid_ratio[scene_id] * 100,
+                cloud_pixels[scene_id], coverage[scene_id] * 100
+            )
 
         quality_report[scene_id] = {
-            "total_pixels": total_pixels,
-            "valid_pixels": valid_pixels,
-            "valid_ratio": valid_ratio,
-            "coverage": coverage
+            "total_pixels": int(total_pixels[scene_id]),
+            "valid_pixels": int(valid_pixels[scene_id]),
+            "valid_ratio": float(valid_ratio[scene_id]),
+            "coverage": float(coverage[scene_id])
         }
 
-    print("[INFO] Generating Quality Report Successful.")
+    logger.info("Generating Quality Report Successful.")
 
     return quality_report
@@ -7,7 +7,12 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.colors as mcolors
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from typing import Union
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
 import xarray as xr
 import numpy as np
 import pandas as pd
@@ -19,7 +24,8 @@ import pandas as pd
 # ==============================================================================
 
 import os
-import yaml
+
+from eo_workflow import config_cache
 
 def load_visualize_scl_parameters(config_path: str = "scl_plot_config.yml") -> dict:
     """
@@ -48,8 +54,7 @@ def load_visualize_scl_parameters(config_path: str = "scl_plot_config.yml") -> d
     if not os.path.isfile(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    config = config_cache.load_yaml_cached(config_path)
 
     if not isinstance(config, dict):
         raise ValueError("YAML content must be a dictionary")
@@ -63,6 +68,108 @@ def load_visualize_scl_parameters(config_path: str = "scl_plot_config.yml") -> d
 
     return config
 
+# ------------------------------------------------------------------------------
+# Constants: standard SCL class labels and discrete color bounds
+# ------------------------------------------------------------------------------
+SCL_CLASSES = {
+    0: "No data",
+    1: "Saturated / defective",
+    2: "Dark area pixels",
+    3: "Cloud shadows",
+    4: "Vegetation",
+    5: "Bare soils",
+    6: "Water",
+    7: "Clouds low probability",
+    8: "Clouds medium probability",
+    9: "Clouds high probability",
+    10: "Cirrus",
+    11: "Snow / ice"
+}
+SCL_BOUNDS = np.arange(-0.5, 12.5, 1)
+
+# ------------------------------------------------------------------------------
+# Function: _scl_style
+# Purpose : Build the discrete colormap, norm and legend handles once per cmap
+# ------------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _scl_style(cmap_name: str) -> tuple:
+    """
+    Return (cmap, norm, legend_handles) for plotting SCL codes with the given colormap.
+    """
+    cmap = plt.get_cmap(cmap_name, len(SCL_CLASSES))
+    norm = mcolors.BoundaryNorm(SCL_BOUNDS, cmap.N)
+    legend_handles = [
+        mpatches.Patch(color=cmap(i), label=f"{i}: {label}")
+        for i, label in SCL_CLASSES.items()
+    ]
+    return cmap, norm, legend_handles
+
+# ------------------------------------------------------------------------------
+# Function: _build_scl_figure
+# Purpose : Draw an SCL layer with title and legend onto an empty figure
+# ------------------------------------------------------------------------------
+def _build_scl_figure(
+    fig: Figure,
+    scl: np.ndarray,
+    title: str,
+    cmap: str,
+    show_axis: bool
+) -> tuple:
+    """
+    Draw an SCL layer onto `fig` and return its (axes, image) artists.
+
+    The returned image can be updated with `image.set_data(...)` to render further
+    scenes of the same shape without rebuilding the axes and the legend.
+    """
+    # Discrete colormap and legend handles, shared across calls
+    cmap, norm, legend_handles = _scl_style(cmap)
+
+    ax = fig.add_subplot()
+    image = ax.imshow(scl, cmap=cmap, norm=norm)
+    ax.set_title(title, fontsize=14)
+
+    if not show_axis:
+        ax.axis("off")
+
+    # Add legend with class labels
+    ax.legend(
+        handles=legend_handles,
+        bbox_to_anchor=(1.05, 1),
+        loc="upper left",
+        borderaxespad=0.0,
+        fontsize=10
+    )
+
+    fig.tight_layout()
+    return ax, image
+
+# ------------------------------------------------------------------------------
+# Function: _render_scl_scenes
+# Purpose : Save a batch of SCL scenes using a single figure (process pool task)
+# ------------------------------------------------------------------------------
+def _render_scl_scenes(
+    scenes: np.ndarray,
+    titles: list[str],
+    save_paths: list[str],
+    cmap: str,
+    figsize: tuple,
+    dpi: int
+) -> None:
+    """
+    Render each scene of a (time, y, x) array to its PNG file.
+
+    The figure, axes and legend are built once for the first scene; every further
+    scene only swaps the image data and the title before saving.
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax, image = _build_scl_figure(fig, scenes[0], titles[0], cmap, show_axis=False)
+
+    for scene, title, save_path in zip(scenes, titles, save_paths):
+        image.set_data(scene)
+        ax.set_title(title, fontsize=14)
+        fig.savefig(save_path, dpi=dpi)
+
 # ------------------------------------------------------------------------------
 # Function: plot_scl_layer
 # Purpose : Plot a single Sentinel-2 Scene Classification (SCL) layer.
@@ -74,7 +181,8 @@ def plot_scl_layer(
     cmap: str = "tab20",
     figsize: tuple = (10, 8),
     show_axis: bool = False,
-    save_path: Union[str, None] = None
+    save_path: Union[str, None] = None,
+    dpi: int = 150
 ) -> None:
     """
     Plot a single SCL layer using predefined Sentinel-2 class labels and colors.
@@ -99,54 +207,21 @@ def plot_scl_layer(
     save_path : str or None, optional
         File path to save the figure (e.g., "output.png").
         If None, the plot is shown interactively.
-    """
-    # Define standard SCL class labels
-    scl_classes = {
-        0: "No data",
-        1: "Saturated / defective",
-        2: "Dark area pixels",
-        3: "Cloud shadows",
-        4: "Vegetation",
-        5: "Bare soils",
-        6: "Water",
-        7: "Clouds low probability",
-        8: "Clouds medium probability",
-        9: "Clouds high probability",
-        10: "Cirrus",
-        11: "Snow / ice"
-    }
-
-    # Build a discrete colormap
-    cmap = plt.get_cmap(cmap, 12)
-    bounds = np.arange(-0.5, 12.5, 1)
-    norm = mcolors.BoundaryNorm(bounds, cmap.N)
-
-    # Create plot
-    plt.figure(figsize=figsize)
-    img = plt.imshow(scl, cmap=cmap, norm=norm)
-    plt.title(title, fontsize=14)
 
-    if not show_axis:
-        plt.axis("off")
-
-    # Add legend with class labels
-    legend_handles = [
-        mpatches.Patch(color=cmap(i), label=f"{i}: {label}")
-        for i, label in scl_classes.items()
-    ]
-    plt.legend(
-        handles=legend_handles,
-        bbox_to_anchor=(1.05, 1),
-        loc="upper left",
-        borderaxespad=0.0,
-        fontsize=10
-    )
+    dpi : int, optional
+        Resolution of the saved figure (default: 150). Use 300 for publication output.
+    """
+    # Saved figures are rendered off-screen with Agg, bypassing pyplot and any GUI backend
+    if save_path:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    else:
+        fig = plt.figure(figsize=figsize)
 
-    plt.tight_layout()
+    _build_scl_figure(fig, scl, title, cmap, show_axis)
 
     if save_path:
-        plt.savefig(save_path, dpi=300)
-        plt.close()
+        fig.savefig(save_path, dpi=dpi)
     else:
         plt.show()
 
@@ -161,11 +236,19 @@ def plot_all_scl_scenes(
     scl_band: str = "scl",
     cmap: str = "tab20",
     figsize: tuple = (10, 8),
-    save_dir: Union[str, None] = None
+    save_dir: Union[str, None] = None,
+    max_workers: Union[int, None] = None,
+    dpi: int = 150
 ) -> None:
     """
     Plot all scenes of the SCL band over time from a multi-temporal dataset.
 
+    When saving to disk, the scenes are rendered in small batches by worker
+    processes. A batch is loaded in the calling process only when it is about to
+    be submitted, and at most two batches per worker are in flight, so the full
+    SCL cube is never held in memory at once. Each batch builds its figure once
+    and only swaps the image data between scenes.
+
     Parameters
     ----------
     dataset : xr.Dataset
@@ -182,7 +265,14 @@ def plot_all_scl_scenes(
 
     save_dir : str or None, optional
         Directory path to save all plots.
-        If None, plots are shown interactively.
+        If None, plots are shown interactively (one after another).
+
+    max_workers : int or None, optional
+        Number of worker processes used when saving plots
+        (default: None, i.e. one per CPU core).
+
+    dpi : int, optional
+        Resolution of the saved figures (default: 150).
     """
     if scl_band not in dataset:
         raise ValueError(f"Dataset does not contain band '{scl_band}'")
@@ -192,21 +282,49 @@ def plot_all_scl_scenes(
     if "time" not in scl.dims:
         raise ValueError("SCL band must have a 'time' dimension")
 
-    for scene_id in range(scl.sizes["time"]):
-        scene = scl.isel(time=scene_id)
-        timestamp = pd.to_datetime(scene.time.values).strftime("%Y-%m-%d")
-
-        title = f"SCL Layer – {timestamp}"
-        save_path = None
-        if save_dir:
-            os.makedirs(save_dir, exist_ok=True)
-            save_path = os.path.join(save_dir, f"scl_{timestamp}.png")
-
-        plot_scl_layer(
-            scl=scene,
-            title=title,
-            cmap=cmap,
-            figsize=figsize,
-            show_axis=False,
-            save_path=save_path
-        )
+    # Format all scene dates once instead of converting each scene's timestamp
+    timestamps = pd.DatetimeIndex(scl.time.values).strftime("%Y-%m-%d")
+
+    if not save_dir:
+        for scene_id, timestamp in enumerate(timestamps):
+            plot_scl_layer(
+                scl=scl.isel(time=scene_id),
+                title=f"SCL Layer – {timestamp}",
+                cmap=cmap,
+                figsize=figsize,
+                show_axis=False
+            )
+        return
+
+    os.makedirs(save_dir, exist_ok=True)
+    if len(timestamps) == 0:
+        return
+
+    titles = [f"SCL Layer – {timestamp}" for timestamp in timestamps]
+    save_paths = [os.path.join(save_dir, f"scl_{timestamp}.png") for timestamp in timestamps]
+
+    # Rendering and PNG encoding are CPU-bound, so batches of scenes run in separate processes
+    n_workers = min(max_workers or os.cpu_count() or 1, len(timestamps))
+    batch_size = max(1, min(8, -(-len(timestamps) // n_workers)))
+    max_in_flight = 2 * n_workers
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        pending = deque()
+        for start in range(0, len(timestamps), batch_size):
+            # Wait for the oldest batch before loading the next one to bound memory use
+            if len(pending) >= max_in_flight:
+                pending.popleft().result()
+
+            stop = start + batch_size
+            pending.append(executor.submit(
+                _render_scl_scenes,
+                scl.isel(time=slice(start, stop)).values,
+                titles[start:stop],
+                save_paths[start:stop],
+                cmap,
+                figsize,
+                dpi
+            ))
+
+        for future in pending:
+            future.result()
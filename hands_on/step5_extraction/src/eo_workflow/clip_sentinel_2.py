@@ -12,6 +12,23 @@ import xarray as xr
 import geopandas as gpd
 from shapely import box
 import rioxarray
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------------------
+# Function: _reproject_bbox
+# Purpose : Reproject a bounding box to a target CRS (memoized)
+# ------------------------------------------------------------------------------
+@lru_cache(maxsize=32)
+def _reproject_bbox(bbox: tuple, src_crs: str, dst_crs_wkt: str) -> tuple:
+    """
+    Return the bounds (minx, miny, maxx, maxy) of `bbox` reprojected from
+    `src_crs` to the CRS given as WKT.
+    """
+    bounds = gpd.GeoSeries([box(*bbox)], crs=src_crs).to_crs(dst_crs_wkt).total_bounds
+    return tuple(float(v) for v in bounds)
 
 # ------------------------------------------------------------------------------
 # Function: clip_dataset_to_bbox
@@ -24,10 +41,11 @@ def clip_dataset_to_bbox(
     crs: str = "EPSG:4326"
 ) -> xr.Dataset:
     """
-    Clip all spatial bands in a Sentinel-2 dataset to a bounding box for each time step.
+    Clip all spatial bands in a Sentinel-2 dataset to a bounding box.
 
-    This function uses rioxarray and geopandas to apply a spatial mask to the dataset,
-    returning a clipped dataset that retains all bands and time information.
+    This function reprojects the bounding box to the dataset CRS with geopandas and
+    slices the dataset to that window with rioxarray, returning a clipped dataset
+    that retains all bands and time information.
 
     Parameters
     ----------
@@ -50,53 +68,31 @@ def clip_dataset_to_bbox(
     Raises
     ------
     ValueError
-        If the dataset is None or does not contain rioxarray-enabled data variables.
+        If the dataset is None or has no CRS set.
     """
     if dataset is None:
         raise ValueError("Input dataset is None. Please ensure the dataset is loaded correctly.")
-    print("[INFO] Starting dataset clipping...")
+    logger.info("Starting dataset clipping...")
 
     # ------------------------------------------------------------------------------
-    # Step 1: Identify a representative rioxarray-enabled variable to obtain CRS
+    # Step 1: Make sure the dataset carries a CRS to reproject the bounding box to
     # ------------------------------------------------------------------------------
-    example_var = next((v for v in dataset.data_vars if hasattr(dataset[v], "rio")), None)
-    if example_var is None:
-        raise ValueError("No rioxarray-enabled variable found in the dataset.")
-    print(f"[INFO] Identified rioxarray-enabled variable: '{example_var}'")
+    dataset_crs = dataset.rio.crs
+    if dataset_crs is None:
+        raise ValueError("Dataset has no CRS set.")
+    logger.info("Identified dataset CRS: %s", dataset_crs)
 
     # ------------------------------------------------------------------------------
-    # Step 2: Construct the clipping geometry from the input bounding box
+    # Step 2: Reproject the input bounding box to the dataset CRS
     # ------------------------------------------------------------------------------
-    geom = box(*bbox)
-    print(f"[INFO] Created clipping geometry from bounding box: {bbox}")
-
-    gdf = gpd.GeoDataFrame(geometry=[geom], crs=crs).to_crs(dataset.rio.crs)
-    print(f"[INFO] Reprojected bounding box to match dataset CRS: {dataset.rio.crs}")
+    # Repeated calls with the same bbox and CRS skip the PROJ transform
+    bounds = _reproject_bbox(tuple(bbox), crs, dataset_crs.to_wkt())
+    logger.info("Reprojected bounding box to match dataset CRS: %s", dataset_crs)
 
     # ------------------------------------------------------------------------------
-    # Step 3: Iterate through time slices (if applicable) and clip each one
+    # Step 3: Clip all bands and time slices to the bounding window
     # ------------------------------------------------------------------------------
-    has_time = "time" in dataset.dims
-    time_values = dataset.time.values if has_time else [None]
-    clipped_list = []
-
-    for t in time_values:
-        if t is not None:
-            ds_t = dataset.sel(time=t)
-        else:
-            ds_t = dataset
-
-        clipped_t = ds_t.rio.clip(gdf.geometry.values, gdf.crs, drop=True)
-
-        if t is not None:
-            clipped_t = clipped_t.expand_dims(time=[t])
-
-        clipped_list.append(clipped_t)
-
-    # ------------------------------------------------------------------------------
-    # Step 4: Return the clipped dataset (concatenate over time if needed)
-    # ------------------------------------------------------------------------------
-    clipped_ds = xr.concat(clipped_list, dim="time") if has_time else clipped_list[0]
-    print("[INFO] Clipping completed.")
+    # An axis-aligned box only needs index slicing, no rasterized mask
+    clipped_ds = dataset.rio.clip_box(*bounds)
+    logger.info("Clipping completed.")
     return clipped_ds
-
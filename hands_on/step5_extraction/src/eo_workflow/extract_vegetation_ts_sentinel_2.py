@@ -7,11 +7,13 @@
 # ------------------------------------------------------------------------------
 # Imports
 # ------------------------------------------------------------------------------
+import logging
 import xarray as xr
 import numpy as np
 import pandas as pd
+from typing import Optional
 
-from eo_workflow import util
+logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------------------
 # Function: vegetation_time_series
@@ -22,7 +24,9 @@ def vegetation_time_series(
     data_set: xr.Dataset, 
     pixel_size: float = 10.0, 
     min_coverage: float = 0.6,
-    aggregated: bool = True
+    aggregated: bool = True,
+    scl_summary: Optional[xr.Dataset] = None,
+    verbose: bool = False
 ) -> pd.DataFrame:
     """
     Generate a time series of vegetation surface area using Sentinel-2 SCL band.
@@ -44,6 +48,16 @@ def vegetation_time_series(
         If True, timestamps will be aggregated to daily resolution (YYYY-MM-DD).
         If False, full timestamps are retained (YYYY-MM-DDTHH:MM:SS).
 
+    scl_summary : xr.Dataset, optional
+        Precomputed result of `quality_sentinel_2.scl_summary`. If given, its
+        'vegetation_pixels' counts are reused instead of reading the SCL band again.
+        Scenes are matched by position: either the summary covers exactly the scenes
+        of `data_set`, or `data_set` carries a 'scene_id' coordinate with each
+        scene's position in the summary (e.g. after filtering a subset of scenes).
+
+    verbose : bool, optional
+        If True, log the vegetation pixel count and area of each scene (default: False).
+
     Returns
     -------
     pd.DataFrame
@@ -78,35 +92,45 @@ def vegetation_time_series(
     if "time" not in scl.dims:
         raise ValueError("SCL band must have a 'time' dimension.")
 
-    # Output containers
-    vegetation_areas = []
-    date_labels = []
-
-    # Total pixels and total area (in km²) for a full scene
-    total_pixels = data_set.sizes["y"] * data_set.sizes["x"]
-    total_area_km2 = (total_pixels * pixel_size**2) / 1e6  # m² to km²
-
-    for scene_id in range(scl.sizes["time"]):
-        scene = scl.isel(time=scene_id)
-        timestamp = pd.to_datetime(scene.time.values)
-        timestamp_str = timestamp.strftime("%Y-%m-%d" if aggregated else "%Y-%m-%dT%H:%M:%S")
-
-        # Compute SCL histogram
-        classes, frequencies = util.calculate_scl_histogram(scene)
-
-        # Extract vegetation pixel count (class 4)
-        try:
-            vegetation_pixel_count = frequencies[classes.index(4)]
-        except ValueError:
-            vegetation_pixel_count = 0
-
-        vegetation_area_km2 = (vegetation_pixel_count * pixel_size**2) / 1e6
-
-        print(f"[INFO] {timestamp_str}: vegetation pixel = {vegetation_pixel_count}; vegetation area = {vegetation_area_km2:.2f} km^2")
-
-        # Store results
-        vegetation_areas.append(vegetation_area_km2)
-        date_labels.append(timestamp_str)
+    if scl_summary is not None:
+        # Reuse the vegetation counts from the shared SCL pass. Scenes are aligned by
+        # position: without aggregation several scenes may share one timestamp.
+        if "scene_id" in scl.coords:
+            positions = scl["scene_id"].values
+        else:
+            positions = np.arange(scl.sizes["time"])
+
+        summary_times = scl_summary["time"].values
+        if (
+            positions.size != scl.sizes["time"]
+            or (positions.size and (positions.min() < 0 or positions.max() >= summary_times.size))
+            or not np.array_equal(summary_times[positions], scl.time.values)
+        ):
+            raise ValueError("scl_summary does not cover the scenes of data_set.")
+
+        vegetation_pixel_counts = scl_summary["vegetation_pixels"].values[positions]
+    else:
+        # Count vegetation pixels (class 4) for all scenes in a single lazy reduction
+        vegetation_pixel_counts = (scl == 4).sum(dim=("y", "x")).compute().values
+
+    # Convert pixel counts to surface area (m² to km²) with a single multiply
+    pixel_area_km2 = (pixel_size * pixel_size) / 1e6
+    vegetation_areas = vegetation_pixel_counts * pixel_area_km2
+
+    # Format all timestamps in one vectorized call
+    date_labels = pd.to_datetime(scl.time.values).strftime(
+        "%Y-%m-%d" if aggregated else "%Y-%m-%dT%H:%M:%S"
+    )
+
+    # Skip the per-scene loop entirely when INFO records are filtered out
+    if verbose and logger.isEnabledFor(logging.INFO):
+        for timestamp_str, pixel_count, area_km2 in zip(date_labels, vegetation_pixel_counts, vegetation_areas):
+            logger.info(
+                "%s: vegetation pixel = %d; vegetation area = %.2f km^2",
+                timestamp_str, pixel_count, area_km2
+            )
+
+    logger.info("Extracted vegetation area for %d scenes.", len(date_labels))
 
     # Construct output DataFrame
     time_series = {
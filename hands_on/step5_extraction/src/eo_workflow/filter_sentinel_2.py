@@ -8,13 +8,15 @@
 # ------------------------------------------------------------------------------
 # Import Required Libraries
 # ------------------------------------------------------------------------------
+import logging
 import xarray as xr
 import pandas as pd
 import numpy as np
 import os
-import yaml
 
-from eo_workflow import util
+from eo_workflow import config_cache
+
+logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------------------
 # Constants
@@ -48,8 +50,7 @@ def load_filter_parameters(yaml_path: str = "filter_parameters.yml") -> dict:
     """
     yaml_path = os.path.abspath(os.path.expanduser(yaml_path))
 
-    with open(yaml_path, "r") as file:
-        config = yaml.safe_load(file)
+    config = config_cache.load_yaml_cached(yaml_path)
 
     for key in REQUIRED_KEYS:
         if key not in config:
@@ -110,7 +111,7 @@ def filter_scenes_by_validity_ratio(
     ValueError
         If required variables ('scl', 'time') are missing or no valid scenes remain.
     """
-    print("[INFO] Filter Scenes...")
+    logger.info("Filter Scenes...")
 
     # Validate input
     if not isinstance(data_set, xr.Dataset):
@@ -122,26 +123,31 @@ def filter_scenes_by_validity_ratio(
     if "time" not in scl.dims:
         raise ValueError("SCL data must have a 'time' dimension.")
 
-    # Iterate through scenes and evaluate quality metrics
-    keep_indices = []
-
-    for scene_id, quality_stats in quality_report.items():
-        valid = quality_stats.get("valid_ratio", 0.0) >= validity_threshold
-        coverage = quality_stats.get("coverage", 0.0) >= coverage_threshold
-
-        scene = util.get_scene_by_scene_id(data_set, scene_id)
-        timestamp = pd.to_datetime(scene.time.values)
-        timestamp_str = timestamp.strftime("%Y-%m-%d" if aggregation else "%Y-%m-%dT%H:%M:%S")
-
-        if valid and coverage:
-            keep_indices.append(scene_id)
-            if verbose:
-                print(f"[INFO] {timestamp_str}: valid = {quality_stats['valid_ratio']:.2%} — scene kept")
-        elif verbose:
-            print(f"[INFO] {timestamp_str}: valid = {quality_stats['valid_ratio']:.2%} — scene removed")
+    # Evaluate quality metrics for all scenes at once
+    scene_ids = np.fromiter(quality_report.keys(), dtype=np.int64, count=len(quality_report))
+    valid_ratios = np.fromiter(
+        (q.get("valid_ratio", 0.0) for q in quality_report.values()), dtype=float, count=len(quality_report)
+    )
+    coverages = np.fromiter(
+        (q.get("coverage", 0.0) for q in quality_report.values()), dtype=float, count=len(quality_report)
+    )
+
+    keep_mask = (valid_ratios >= validity_threshold) & (coverages >= coverage_threshold)
+    keep_indices = scene_ids[keep_mask].tolist()
+
+    # Per-scene records are only created when INFO logging is enabled
+    if verbose and logger.isEnabledFor(logging.INFO):
+        timestamps = pd.DatetimeIndex(data_set.time.values[scene_ids]).strftime(
+            "%Y-%m-%d" if aggregation else "%Y-%m-%dT%H:%M:%S"
+        )
+        for timestamp_str, valid_ratio, kept in zip(timestamps, valid_ratios, keep_mask):
+            logger.info(
+                "%s: valid = %.2f%% — scene %s",
+                timestamp_str, valid_ratio * 100, "kept" if kept else "removed"
+            )
 
     if not keep_indices:
         raise ValueError("No valid scenes found above the specified thresholds.")
 
-    print("[INFO] Filter Scenes Successful.")
+    logger.info("Filter Scenes Successful.")
     return data_set.isel(time=keep_indices)
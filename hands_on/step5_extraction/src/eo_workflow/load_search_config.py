@@ -5,6 +5,8 @@
 
 import yaml
 
+from eo_workflow import config_cache
+
 def load_config(config_path: str = "search_config.yml") -> dict:
     """
     Load Sentinel-2 STAC search configuration from a YAML file.
@@ -20,8 +22,8 @@ def load_config(config_path: str = "search_config.yml") -> dict:
               - cloud_cover_threshold (float)
     """
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        # Parsed once per file version; later calls reuse the cached content
+        config = config_cache.load_yaml_cached(config_path)
 
         # Basic validation
         if not isinstance(config.get("catalog_url"), str):
@@ -2,13 +2,14 @@
 # File: scl_histogram_utils.py
 # Purpose: Utility functions for extracting and analyzing the Scene Classification
 #          Layer (SCL) from Sentinel-2 STAC datasets using xarray.
-#          Includes pixel-level histogram computation and scene access.
+#          Includes pixel-level histogram computation.
 # Autor: Mike Sips
 # ==============================================================================
 
 import xarray as xr
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
+from functools import lru_cache
 
 def calculate_nvdi_histogram(
     ndvi: xr.DataArray,
@@ -34,26 +35,129 @@ def calculate_nvdi_histogram(
     if not isinstance(ndvi, xr.DataArray):
         raise TypeError("ndvi must be an xarray.DataArray")
 
-    # Flatten the NDVI values
-    flat_values = ndvi.values.ravel()
+    # NaNs fall outside the finite bin edges, so no explicit mask is needed
+    bins = np.asarray(bins, dtype=float)
 
-    # Remove NaNs before histogram computation
-    valid_values = flat_values[~np.isnan(flat_values)]
-
-    # Compute histogram
-    frequencies, bins = np.histogram(valid_values, bins=bins)
+    if ndvi.chunks is not None:
+        # Stream the Dask-backed array chunk by chunk instead of materializing it
+        import dask.array as da
+        frequencies = da.histogram(ndvi.data, bins=bins)[0].compute()
+    else:
+        frequencies, bins = np.histogram(ndvi.values, bins=bins)
 
     # Convert to lists
     return bins.tolist(), frequencies.tolist()
 
+# ------------------------------------------------------------------------------
+# Function: _scl_hist_u8_kernel
+# Purpose : Build the Numba uint8 SCL counting kernel on first use
+# ------------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _scl_hist_u8_kernel():
+    """
+    Return a Numba kernel that computes a 256-bin histogram of a contiguous,
+    flattened uint8 buffer, or None if Numba is not installed.
+
+    Numba is optional and only imported (and the kernel only defined) the first
+    time a histogram is computed, so importing this module stays cheap.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def _scl_hist_u8(buf: np.ndarray) -> np.ndarray:
+        # The buffer is split into strips that are counted in parallel into
+        # thread-local histograms, which are summed at the end
+        n = buf.size
+        n_strips = max(1, min(64, n // 65536))
+        strip = (n + n_strips - 1) // n_strips
+        local = np.zeros((n_strips, 256), dtype=np.int64)
+
+        for s in prange(n_strips):
+            start = s * strip
+            stop = min(start + strip, n)
+            for i in range(start, stop):
+                local[s, buf[i]] += 1
+
+        hist = np.zeros(256, dtype=np.int64)
+        for s in range(n_strips):
+            hist += local[s]
+        return hist
+
+    return _scl_hist_u8
+
+# ------------------------------------------------------------------------------
+# Function: _scl_hist_u8_serial_kernel
+# Purpose : Build the single-threaded Numba uint8 SCL counting kernel on first use
+# ------------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _scl_hist_u8_serial_kernel():
+    """
+    Return a single-threaded Numba kernel that computes a 256-bin histogram of a
+    flattened uint8 buffer, or None if Numba is not installed.
+
+    Used for the per-scene counts inside Dask tasks: the tasks already run in
+    parallel, and the kernel releases the GIL so that Dask's worker threads count
+    their scenes concurrently without nesting a second thread pool.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(nogil=True, cache=True)
+    def _scl_hist_u8_serial(buf: np.ndarray) -> np.ndarray:
+        hist = np.zeros(256, dtype=np.int64)
+        for i in range(buf.size):
+            hist[buf[i]] += 1
+        return hist
+
+    return _scl_hist_u8_serial
+
+# np.bincount widens its input to intp internally; counting uint8 codes in blocks
+# of this many pixels keeps that temporary small (512 KiB) and cache-resident
+_BINCOUNT_BLOCK = 1 << 16
+
+# ------------------------------------------------------------------------------
+# Function: _bincount_u8
+# Purpose : Count uint8 SCL codes blockwise when Numba is unavailable
+# ------------------------------------------------------------------------------
+def _bincount_u8(values: np.ndarray) -> np.ndarray:
+    """
+    Count the 256 possible values of a 1D uint8 array without Numba.
+    """
+    counts = np.zeros(256, dtype=np.int64)
+    for start in range(0, values.size, _BINCOUNT_BLOCK):
+        counts += np.bincount(values[start:start + _BINCOUNT_BLOCK], minlength=256)
+    return counts
+
+# ------------------------------------------------------------------------------
+# Function: _as_scl_u8
+# Purpose : Narrow SCL codes to one byte per pixel before counting
+# ------------------------------------------------------------------------------
+def _as_scl_u8(values: np.ndarray) -> np.ndarray:
+    """
+    Return 1D SCL codes as uint8, dropping NaN / negative / out-of-range values.
+
+    uint8 input is returned unchanged. Wider input is copied once into uint8; the
+    nodata mask is only built when a min/max check shows that it is needed.
+    """
+    if values.dtype == np.uint8:
+        return values
+    if values.size and not (values.min() >= 0 and values.max() < 256):
+        values = values[(values >= 0) & (values < 256)]
+    return values.astype(np.uint8)
+
 # ------------------------------------------------------------------------------
 # Function: calculate_scl_histogram
 # Purpose : Compute pixel counts for each valid class in a 2D SCL scene
 # ------------------------------------------------------------------------------
 def calculate_scl_histogram(
     scl_scene: xr.DataArray,
-    valid_classes: list[int] = list(range(12))
-) -> Tuple[list[int], list[int]]:
+    valid_classes: Optional[list[int]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Calculate a histogram of SCL class frequencies from a 2D scene.
 
@@ -65,13 +169,13 @@ def calculate_scl_histogram(
 
     valid_classes : list of int, optional
         List of SCL classification codes to count.
-        Default: list(range(12)) includes classes 0–11.
+        Default: None, i.e. all classes 0–11.
 
     Returns
     -------
-    tuple of (list[int], list[int])
-        - classes: Sorted list of SCL codes that were counted.
-        - frequencies: Corresponding pixel counts per SCL class.
+    tuple of (np.ndarray, np.ndarray)
+        - classes: Sorted, unique SCL codes that were counted (int64).
+        - frequencies: Corresponding pixel counts per SCL class (int64).
 
     Raises
     ------
@@ -82,63 +186,96 @@ def calculate_scl_histogram(
         raise TypeError("scl_scene must be an xarray.DataArray.")
     if scl_scene.ndim != 2:
         raise ValueError("scl_scene must be a 2D array (single scene).")
-    if not isinstance(valid_classes, list) or not all(isinstance(c, int) for c in valid_classes):
+    if valid_classes is not None and (
+        not isinstance(valid_classes, list) or not all(isinstance(c, int) for c in valid_classes)
+    ):
         raise TypeError("valid_classes must be a list of integers.")
 
-    values = scl_scene.values.ravel()
-    counts = {cls: np.count_nonzero(values == cls) for cls in valid_classes}
-    classes = sorted(counts.keys())
-    frequencies = [counts[cls] for cls in classes]
-    return classes, frequencies
+    return calculate_scl_histogram_np(scl_scene.values, valid_classes)
 
 # ------------------------------------------------------------------------------
-# Function: get_scene_by_scene_id
-# Purpose : Retrieve a single scene from the SCL band using its time index
+# Function: calculate_scl_histogram_np
+# Purpose : Compute SCL class counts for a scene given as a plain NumPy array
 # ------------------------------------------------------------------------------
-def get_scene_by_scene_id(
-    data_set: xr.Dataset,
-    scene_id: int,
-    scl_band: str = "scl"
-) -> xr.DataArray:
+def calculate_scl_histogram_np(
+    scl_values: np.ndarray,
+    valid_classes: Optional[list[int]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Extract a specific scene from the SCL band in an xarray Dataset.
+    Calculate a histogram of SCL class frequencies from a NumPy array of SCL codes.
+
+    Same result as `calculate_scl_histogram`, but without the xarray wrapper and
+    input checks. Intended for loops over scenes of a stack that was materialized
+    once (e.g. `arr = scl.values; calculate_scl_histogram_np(arr[t])`).
 
     Parameters
     ----------
-    data_set : xr.Dataset
-        The input xarray Dataset containing a time series of Sentinel-2 data.
+    scl_values : np.ndarray
+        SCL codes of a scene (any shape; all pixels are counted).
 
-    scene_id : int
-        Index of the time step (scene) to extract.
-
-    scl_band : str, optional
-        Name of the SCL band in the dataset. Default is "scl".
+    valid_classes : list of int, optional
+        List of SCL classification codes to count.
+        Default: None, i.e. all classes 0–11.
 
     Returns
     -------
-    xr.DataArray
-        A 2D DataArray representing the SCL values at the specified time step.
+    tuple of (np.ndarray, np.ndarray)
+        - classes: Sorted, unique SCL codes that were counted (int64).
+        - frequencies: Corresponding pixel counts per SCL class (int64).
+    """
+    values = _as_scl_u8(np.ascontiguousarray(scl_values).ravel())
 
-    Raises
-    ------
-    TypeError
-        If data_set is not an xarray.Dataset or scene_id is not an integer.
+    # Count the raw bytes without widening to int64
+    scl_hist_u8 = _scl_hist_u8_kernel()
+    if scl_hist_u8 is not None:
+        counts = scl_hist_u8(values)
+    else:
+        counts = _bincount_u8(values)
+
+    # Default selection (None or range(12)): the first 12 bins are already the answer
+    if valid_classes is None or (isinstance(valid_classes, range) and valid_classes == range(12)):
+        return np.arange(12, dtype=np.int64), counts[:12]
+
+    # Gather the requested classes with one fancy-indexing step
+    classes = np.unique(np.asarray(valid_classes, dtype=np.int64))
+    in_range = (classes >= 0) & (classes < counts.size)
+    frequencies = np.zeros(classes.size, dtype=np.int64)
+    frequencies[in_range] = counts[classes[in_range]]
+    return classes, frequencies
 
-    ValueError
-        If scl_band is missing, or scene_id is out of bounds.
+# ------------------------------------------------------------------------------
+# Function: compute_scl_counts
+# Purpose : Count SCL classes for a whole stack of scenes
+# ------------------------------------------------------------------------------
+def compute_scl_counts(block: np.ndarray) -> np.ndarray:
     """
-    if not isinstance(data_set, xr.Dataset):
-        raise TypeError("data_set must be an xarray.Dataset.")
-    if not isinstance(scene_id, int):
-        raise TypeError("scene_id must be an integer.")
-    if scl_band not in data_set:
-        raise ValueError(f"Dataset does not contain the SCL band: '{scl_band}'")
+    Count SCL classes 0–11 over the two trailing (y, x) axes of a NumPy array.
+
+    Each scene is counted on its own with a 256-bin histogram of its codes, so
+    uint8 input needs no mask and no widened copy of the block; wider input is
+    narrowed to uint8 once per scene. This is the
+    counting pass shared by the quality assessment and the vegetation time
+    series (via `quality_sentinel_2.scl_summary`).
 
-    scl = data_set[scl_band]
+    Parameters
+    ----------
+    block : np.ndarray
+        SCL codes with shape (..., y, x), e.g. (time, y, x) for a scene stack.
+
+    Returns
+    -------
+    np.ndarray
+        Integer pixel counts with shape (..., 12), one bin per SCL class 0–11.
+        NaN, negative and out-of-range codes are not counted.
+    """
+    leading_shape = block.shape[:-2]
+    n_scenes = int(np.prod(leading_shape))
+    scenes = block.reshape(n_scenes, block.shape[-2] * block.shape[-1])
 
-    if "time" not in scl.dims:
-        raise ValueError("SCL band must have a 'time' dimension.")
-    if scene_id < 0 or scene_id >= scl.sizes["time"]:
-        raise ValueError(f"scene_id {scene_id} is out of bounds (0 to {scl.sizes['time'] - 1})")
+    # Each Dask task counts its scenes on one thread with the GIL released
+    scl_hist_u8 = _scl_hist_u8_serial_kernel() or _bincount_u8
 
-    return scl.isel(time=scene_id)
+    counts = np.empty((n_scenes, 12), dtype=np.int64)
+    for i, scene in enumerate(scenes):
+        counts[i] = scl_hist_u8(_as_scl_u8(scene))[:12]
+    return counts.reshape(leading_shape + (12,))
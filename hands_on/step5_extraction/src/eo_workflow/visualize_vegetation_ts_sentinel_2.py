@@ -5,9 +5,12 @@
 # ==============================================================================
 
 import os
-import yaml
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from eo_workflow import config_cache
 
 # ------------------------------------------------------------------------------
 # Function: load_visualize_scl_parameters
@@ -43,8 +46,7 @@ def load_visualize_vegetation_ts_parameters(config_path: str = "scl_plot_config.
     if not os.path.isfile(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    config = config_cache.load_yaml_cached(config_path)
 
     if not isinstance(config, dict):
         raise ValueError("YAML content must be a dictionary")
@@ -63,7 +65,8 @@ def load_visualize_vegetation_ts_parameters(config_path: str = "scl_plot_config.
 
 def plot_vegetation_time_series(
     table: pd.DataFrame,
-    save_dir: str
+    save_dir: str,
+    dpi: int = 150
 ) -> None:
     """
     Plot vegetation surface area as a time series.
@@ -78,6 +81,9 @@ def plot_vegetation_time_series(
     save_path : str, optional
         File path to save the generated plot (default: 'vegetation_time_series.png').
 
+    dpi : int, optional
+        Resolution of the saved figure (default: 150). Use 300 for publication output.
+
     Returns
     -------
     None
@@ -86,25 +92,26 @@ def plot_vegetation_time_series(
     table['Date'] = pd.to_datetime(table['Date'])
     table.set_index('Date', inplace=True)
 
-    # Plotting
-    plt.figure(figsize=(10, 6))
-    plt.plot(table.index, table['Vegetation Surface Area'], marker='o', linestyle='-', color='green')
+    # Plotting (rendered off-screen with Agg, bypassing pyplot and any GUI backend)
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(table.index, table['Vegetation Surface Area'], marker='o', linestyle='-', color='green')
 
-    plt.title("Vegetation Surface Area Over Time", fontsize=16)
-    plt.xlabel("Date", fontsize=14)
-    plt.ylabel("Vegetation Surface Area (km²)", fontsize=14)
-    plt.grid(True)
+    ax.set_title("Vegetation Surface Area Over Time", fontsize=16)
+    ax.set_xlabel("Date", fontsize=14)
+    ax.set_ylabel("Vegetation Surface Area (km²)", fontsize=14)
+    ax.grid(True)
 
-    plt.gca().xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%Y-%m-%d'))
-    plt.gca().xaxis.set_major_locator(plt.matplotlib.dates.AutoDateLocator())
-    plt.xticks(rotation=45)
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.tick_params(axis='x', labelrotation=45)
 
     save_path = None
     if save_dir:
         os.makedirs(save_dir, exist_ok=True)
         save_path = os.path.join(save_dir, "vegetation_time_series.png")
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(save_path, dpi=dpi)
     print(f"[INFO] Vegetation time series plot saved to: {save_path}")